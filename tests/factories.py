@@ -2,17 +2,27 @@
 Test Factory to make fake objects for testing
 """
 
-import random
 from datetime import datetime, timezone
 from decimal import Decimal
 
 import factory
-from service.models import Recommendation
+import factory.random
+from sqlalchemy import insert, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from service.models import Recommendation, db
+
+# Built once at import so every bulk insert reuses the same cached statement
+_INSERT = insert(Recommendation).returning(
+    Recommendation.id, sort_by_parameter_order=True
+)
+_INSERT_COLUMNS = tuple(
+    attr.key for attr in inspect(Recommendation).column_attrs if attr.key != "id"
+)
 
 
 def _fake_confidence() -> Decimal:
     # Generate a value in [0.00, 0.99] to satisfy DBs with NUMERIC(2,2)
-    return Decimal(random.randrange(0, 100)) / Decimal(100)
+    return Decimal(factory.random.randgen.randrange(0, 100)) / Decimal(100)
     # return Decimal(random.randrange(-99, 100)) / Decimal(100)
 
 
@@ -43,3 +53,26 @@ class RecommendationFactory(factory.Factory):
 
     created_date = factory.LazyFunction(lambda: datetime.now(timezone.utc))
     updated_date = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+
+    @staticmethod
+    def persist_all(recommendations):
+        """
+        Inserts already built recommendations with one multi-row INSERT
+
+        Nothing is committed, and the instances are attached to the session
+        as persistent rows so later changes to them are tracked as usual.
+        """
+        rows = [
+            {
+                key: value
+                for key in _INSERT_COLUMNS
+                if (value := getattr(recommendation, key)) is not None
+            }
+            for recommendation in recommendations
+        ]
+        ids = db.session.scalars(_INSERT, rows).all()
+        for recommendation, rec_id in zip(recommendations, ids):
+            recommendation.id = rec_id
+            make_transient_to_detached(recommendation)
+            db.session.add(recommendation)
+        return recommendations
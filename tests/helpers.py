@@ -0,0 +1,93 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+"""
+Helper functions shared by the Recommendation test suite
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import cache
+from sqlalchemy import func, inspect, select
+from service.models import Recommendation, db
+from .factories import RecommendationFactory
+
+# Mapped attribute names of every column, computed once at import
+_COLS = tuple(attr.key for attr in inspect(Recommendation).column_attrs)
+
+
+# Built on first use, then reused so new_rec() skips factory_boy's declaration
+# resolution; importing this module runs no Faker providers
+@cache
+def _factory_defaults():
+    """Column values of one factory-built row, minus its id"""
+    template = RecommendationFactory.build()
+    return {key: getattr(template, key) for key in _COLS if key != "id"}
+
+
+# Fixed literals for a valid row, so tests that ignore values skip Faker
+_MINIMAL_FIELDS = {
+    "base_product_id": 1,
+    "recommended_product_id": 2,
+    "recommendation_type": "cross-sell",
+    "status": "active",
+    "confidence_score": Decimal("0.5"),
+}
+
+
+def _as_utc(value):
+    """SQLite hands timestamps back without tzinfo, so read naive ones as UTC"""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def column_values(recommendation):
+    """Returns every column value of a Recommendation as a dict"""
+    return {key: _as_utc(getattr(recommendation, key)) for key in _COLS}
+
+
+def field(rec_id, column):
+    """Selects a single column of one Recommendation without loading the row"""
+    return db.session.scalar(
+        select(getattr(Recommendation, column)).where(Recommendation.id == rec_id)
+    )
+
+
+def row_count():
+    """Counts the stored Recommendations without loading any rows"""
+    count = func.count(Recommendation.id)  # pylint: disable=not-callable
+    return db.session.query(count).scalar()
+
+
+def ids_of(query):
+    """Returns the set of ids matched by a query, loading only the id column"""
+    return {rec_id for (rec_id,) in query.with_entities(Recommendation.id)}
+
+
+def make_min(**kwargs):
+    """Builds a minimal valid Recommendation from fixed literals"""
+    return Recommendation(**{**_MINIMAL_FIELDS, **kwargs})
+
+
+def new_rec(**kwargs):
+    """Builds a Recommendation from the precomputed factory defaults"""
+    return Recommendation(**{**_factory_defaults(), **kwargs})
+
+
+def save_rec(**kwargs):
+    """Inserts a template-built Recommendation, returning the attached instance"""
+    return RecommendationFactory.persist_all([new_rec(**kwargs)])[0]
@@ -20,25 +20,25 @@ CLI Command Extensions for Flask
 
 # pylint: disable=duplicate-code
 import os
-from unittest import TestCase
 from unittest.mock import patch, MagicMock
+import pytest
 from click.testing import CliRunner
 
-# pylint: disable=unused-import
-from wsgi import app  # noqa: F401
-from service.common.cli_commands import db_create  # noqa: E402
 
+######################################################################
+#  F L A S K   C L I   T E S T S
+######################################################################
+@pytest.mark.usefixtures("app_context")
+@patch("service.common.cli_commands.db")
+def test_db_create(db_mock):
+    """It should call the db-create command"""
+    # Imported here because the command registers itself on the app that
+    # app_context builds
+    from service.common.cli_commands import (  # pylint: disable=import-outside-toplevel
+        db_create,
+    )
 
-class TestFlaskCLI(TestCase):
-    """Flask CLI Command Tests"""
-
-    def setUp(self):
-        self.runner = CliRunner()
-
-    @patch("service.common.cli_commands.db")
-    def test_db_create(self, db_mock):
-        """It should call the db-create command"""
-        db_mock.return_value = MagicMock()
-        with patch.dict(os.environ, {"FLASK_APP": "wsgi:app"}, clear=True):
-            result = self.runner.invoke(db_create)
-            self.assertEqual(result.exit_code, 0)
+    db_mock.return_value = MagicMock()
+    with patch.dict(os.environ, {"FLASK_APP": "wsgi:app"}, clear=True):
+        result = CliRunner().invoke(db_create)
+        assert result.exit_code == 0